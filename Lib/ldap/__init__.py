@@ -69,28 +69,40 @@ class LDAPLock:
   """
   _min_trace_level = 3
 
-  def __init__(self,lock_class=None,desc=''):
+  def __init__(self,lock_class=None,desc='',desc_factory=None):
     """
     lock_class
         Class compatible to threading.Lock
     desc
         Description shown in debug log messages
+    desc_factory
+        Callable returning the description, only invoked the first
+        time the description is actually needed
     """
     self._desc = desc
+    self._desc_factory = desc_factory
     self._lock = (lock_class or LDAPLockBaseClass)()
 
+  @property
+  def desc(self):
+    """Description shown in debug log messages"""
+    if self._desc_factory is not None:
+      self._desc = self._desc_factory()
+      self._desc_factory = None
+    return self._desc
+
   def acquire(self):
     if __debug__:
       global _trace_level
       if _trace_level>=self._min_trace_level:
-        _trace_file.write('***{}.acquire() {} {}\n'.format(self.__class__.__name__,repr(self),self._desc))
+        _trace_file.write('***{}.acquire() {} {}\n'.format(self.__class__.__name__,repr(self),self.desc))
     return self._lock.acquire()
 
   def release(self):
     if __debug__:
       global _trace_level
       if _trace_level>=self._min_trace_level:
-        _trace_file.write('***{}.release() {} {}\n'.format(self.__class__.__name__,repr(self),self._desc))
+        _trace_file.write('***{}.release() {} {}\n'.format(self.__class__.__name__,repr(self),self.desc))
     return self._lock.release()
 
 
@@ -10,16 +10,16 @@ from ldap import __version__
 
 import ldif
 
-SEARCH_RESULT_TYPES = {
+SEARCH_RESULT_TYPES = frozenset({
   ldap.RES_SEARCH_ENTRY,
   ldap.RES_SEARCH_RESULT,
   ldap.RES_SEARCH_REFERENCE,
-}
+})
 
-ENTRY_RESULT_TYPES = {
+ENTRY_RESULT_TYPES = frozenset({
   ldap.RES_SEARCH_ENTRY,
   ldap.RES_SEARCH_RESULT,
-}
+})
 
 
 class WrongResultType(Exception):
@@ -32,7 +32,7 @@ class WrongResultType(Exception):
   def __str__(self):
     return 'Received wrong result type {} (expected one of {}).'.format(
       self.receivedResultType,
-      ', '.join(self.expectedResultTypes),
+      ', '.join(map(str,sorted(self.expectedResultTypes))),
     )
 
 
@@ -125,6 +125,7 @@ class AsyncSearchHandler:
     partial = 0
     self.beginResultsDropped = 0
     self.endResultBreak = result_counter
+    process_single_result = self._processSingleResult
     try:
       result_type,result_list = None,None
       while go_ahead:
@@ -140,14 +141,14 @@ class AsyncSearchHandler:
         # Loop over list of search results
         for result_item in result_list:
           if result_counter<ignoreResultsNumber:
-            self.beginResultsDropped = self.beginResultsDropped+1
+            self.beginResultsDropped += 1
           elif processResultsCount==0 or result_counter<end_result_counter:
-            self._processSingleResult(result_type,result_item)
+            process_single_result(result_type,result_item)
           else:
             go_ahead = 0 # break-out from while go_ahead
             partial = 1
             break # break-out from this for-loop
-          result_counter = result_counter+1
+          result_counter += 1
         result_type,result_list = None,None
         self.endResultBreak = result_counter
     finally:
@@ -132,15 +132,15 @@ def DecodeControlTuples(ldapControlTuples,knownLDAPControls=None):
       of response controls known by the application. If None
       ldap.controls.KNOWN_RESPONSE_CONTROLS is used here.
   """
-  knownLDAPControls = knownLDAPControls or KNOWN_RESPONSE_CONTROLS
+  get_control_class = (knownLDAPControls or KNOWN_RESPONSE_CONTROLS).get
   result = []
   for controlType,criticality,encodedControlValue in ldapControlTuples or []:
-    try:
-      control = knownLDAPControls[controlType]()
-    except KeyError:
+    control_class = get_control_class(controlType)
+    if control_class is None:
       if criticality:
         raise ldap.UNAVAILABLE_CRITICAL_EXTENSION('Received unexpected critical response control with controlType %s' % (repr(controlType)))
     else:
+      control = control_class()
       control.controlType,control.criticality = controlType,criticality
       try:
         control.decodeControlValue(encodedControlValue)
@@ -124,7 +124,7 @@ def strf_secs(secs):
     """
     Convert seconds since epoch to a string compliant to LDAP syntax GeneralizedTime
     """
-    return time.strftime('%Y%m%d%H%M%SZ', time.gmtime(secs))
+    return '%04d%02d%02d%02d%02d%02dZ' % time.gmtime(secs)[:6]
 
 
 def strp_secs(dt_str):
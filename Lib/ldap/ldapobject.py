@@ -20,7 +20,9 @@ if __debug__:
   import traceback
 
 import sys,time,pprint,_ldap,ldap,ldap.sasl,ldap.functions
+import functools
 import warnings
+import weakref
 
 from ldap.schema import SCHEMA_ATTRS
 from ldap.controls import LDAPControl,DecodeControlTuples,RequestControlTuples
@@ -102,10 +104,18 @@ class SimpleLDAPObject:
 
   def _ldap_lock(self,desc=''):
     if ldap.LIBLDAP_R:
-      return ldap.LDAPLock(desc='%s within %s' %(desc,repr(self)))
+      return ldap.LDAPLock(desc_factory=self._lock_desc_factory(desc))
     else:
       return ldap._ldap_module_lock
 
+  def _lock_desc_factory(self,desc):
+    """
+    Return a callable rendering a lock description for this instance
+    on demand, avoiding repr(self) unless lock tracing is enabled
+    """
+    self_ref = weakref.ref(self)
+    return lambda: '{} within {!r}'.format(desc,self_ref())
+
   def _ldap_call(self,func,*args,**kwargs):
     """
     Wrapper method mainly for serializing calls into OpenLDAP libs
@@ -560,7 +570,11 @@ class SimpleLDAPObject:
       else:
         resp_type, resp_data, resp_msgid, resp_ctrls, resp_name, resp_value = ldap_result
       if add_ctrls:
-        resp_data = [ (t,r,DecodeControlTuples(c,resp_ctrl_classes)) for t,r,c in resp_data ]
+        # Most entries come without any controls
+        resp_data = [
+          (t,r,DecodeControlTuples(c,resp_ctrl_classes) if c else [])
+          for t,r,c in resp_data
+        ]
     decoded_resp_ctrls = DecodeControlTuples(resp_ctrls,resp_ctrl_classes)
     return resp_type, resp_data, resp_msgid, decoded_resp_ctrls, resp_name, resp_value
 
@@ -817,6 +831,19 @@ class SimpleLDAPObject:
     ).get(name, [])
 
 
+def _reconnect_sync_method(func):
+  """
+  Return a ReconnectLDAPObject method which calls the synchronous
+  SimpleLDAPObject method func with automatic reconnect
+  """
+  @functools.wraps(func)
+  def method(self,*args,**kwargs):
+    return self._apply_method_s(func,*args,**kwargs)
+  # functools.wraps() copied the qualified name of the wrapped method
+  method.__qualname__ = 'ReconnectLDAPObject.'+func.__name__
+  return method
+
+
 class ReconnectLDAPObject(SimpleLDAPObject):
   """
   :py:class:`SimpleLDAPObject` subclass whose synchronous request methods
@@ -835,13 +862,13 @@ class ReconnectLDAPObject(SimpleLDAPObject):
   This class also implements the pickle protocol.
   """
 
-  __transient_attrs__ = {
+  __transient_attrs__ = frozenset({
     '_l',
     '_ldap_object_lock',
     '_trace_file',
     '_reconnect_lock',
     '_last_bind',
-  }
+  })
 
   def __init__(
     self,uri,
@@ -864,7 +891,7 @@ class ReconnectLDAPObject(SimpleLDAPObject):
                               trace_stack_limit, bytes_mode,
                               bytes_strictness=bytes_strictness,
                               fileno=fileno)
-    self._reconnect_lock = ldap.LDAPLock(desc='reconnect lock within %s' % (repr(self)))
+    self._reconnect_lock = ldap.LDAPLock(desc_factory=self._lock_desc_factory('reconnect lock'))
     self._retry_max = retry_max
     self._retry_delay = retry_delay
     self._start_tls = 0
@@ -872,12 +899,17 @@ class ReconnectLDAPObject(SimpleLDAPObject):
 
   def __getstate__(self):
     """return data representation for pickled object"""
+    transient_attrs = self.__transient_attrs__
     state = {
         k: v
-        for k,v in self.__dict__.items()
-        if k not in self.__transient_attrs__
+        for k,v in vars(self).items()
+        if k not in transient_attrs
     }
-    state['_last_bind'] = self._last_bind[0].__name__, self._last_bind[1], self._last_bind[2]
+    if self._last_bind is not None:
+      func,args,kwargs = self._last_bind
+      state['_last_bind'] = func.__name__,args,kwargs
+    else:
+      state['_last_bind'] = None
     return state
 
   def __setstate__(self,d):
@@ -888,9 +920,11 @@ class ReconnectLDAPObject(SimpleLDAPObject):
     else:
         d.setdefault('bytes_strictness', 'warn')
     self.__dict__.update(d)
-    self._last_bind = getattr(SimpleLDAPObject, self._last_bind[0]), self._last_bind[1], self._last_bind[2]
+    if self._last_bind is not None:
+      func_name,args,kwargs = self._last_bind
+      self._last_bind = getattr(SimpleLDAPObject,func_name),args,kwargs
     self._ldap_object_lock = self._ldap_lock()
-    self._reconnect_lock = ldap.LDAPLock(desc='reconnect lock within %s' % (repr(self)))
+    self._reconnect_lock = ldap.LDAPLock(desc_factory=self._lock_desc_factory('reconnect lock'))
     # XXX cannot pickle file, use default trace file
     self._trace_file = ldap._trace_file
     self.reconnect(self._uri,force=True)
@@ -911,8 +945,7 @@ class ReconnectLDAPObject(SimpleLDAPObject):
     for k,v in self._options:
       SimpleLDAPObject.set_option(self,k,v)
 
-  def passwd_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.passwd_s,*args,**kwargs)
+  passwd_s = _reconnect_sync_method(SimpleLDAPObject.passwd_s)
 
   def reconnect(self,uri,retry_max=1,retry_delay=60.0,force=True):
     # Drop and clean up old connection completely
@@ -925,9 +958,10 @@ class ReconnectLDAPObject(SimpleLDAPObject):
         else:
           return
       reconnect_counter = retry_max
+      trace = __debug__ and self._trace_level>=1
       while reconnect_counter:
-        counter_text = '%d. (of %d)' % (retry_max-reconnect_counter+1,retry_max)
-        if __debug__ and self._trace_level>=1:
+        if trace:
+          counter_text = '%d. (of %d)' % (retry_max-reconnect_counter+1,retry_max)
           self._trace_file.write('*** Trying {} reconnect to {}...\n'.format(
             counter_text,uri
           ))
@@ -945,22 +979,22 @@ class ReconnectLDAPObject(SimpleLDAPObject):
             SimpleLDAPObject.unbind_s(self)
             raise
         except (ldap.SERVER_DOWN,ldap.TIMEOUT):
-          if __debug__ and self._trace_level>=1:
+          if trace:
             self._trace_file.write('*** {} reconnect to {} failed\n'.format(
               counter_text,uri
             ))
-          reconnect_counter = reconnect_counter-1
+          reconnect_counter -= 1
           if not reconnect_counter:
             raise
-          if __debug__ and self._trace_level>=1:
+          if trace:
             self._trace_file.write('=> delay %s...\n' % (retry_delay))
           time.sleep(retry_delay)
         else:
-          if __debug__ and self._trace_level>=1:
+          if trace:
             self._trace_file.write('*** {} reconnect to {} successful => repeat last operation\n'.format(
               counter_text,uri
             ))
-          self._reconnects_done = self._reconnects_done + 1
+          self._reconnects_done += 1
           break
     finally:
       self._reconnect_lock.release()
@@ -1008,32 +1042,15 @@ class ReconnectLDAPObject(SimpleLDAPObject):
     self._store_last_bind(SimpleLDAPObject.sasl_bind_s,*args,**kwargs)
     return res
 
-  def add_ext_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.add_ext_s,*args,**kwargs)
-
-  def cancel_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.cancel_s,*args,**kwargs)
-
-  def compare_ext_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.compare_ext_s,*args,**kwargs)
-
-  def delete_ext_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.delete_ext_s,*args,**kwargs)
-
-  def extop_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.extop_s,*args,**kwargs)
-
-  def modify_ext_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.modify_ext_s,*args,**kwargs)
-
-  def rename_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.rename_s,*args,**kwargs)
-
-  def search_ext_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.search_ext_s,*args,**kwargs)
-
-  def whoami_s(self,*args,**kwargs):
-    return self._apply_method_s(SimpleLDAPObject.whoami_s,*args,**kwargs)
+  add_ext_s = _reconnect_sync_method(SimpleLDAPObject.add_ext_s)
+  cancel_s = _reconnect_sync_method(SimpleLDAPObject.cancel_s)
+  compare_ext_s = _reconnect_sync_method(SimpleLDAPObject.compare_ext_s)
+  delete_ext_s = _reconnect_sync_method(SimpleLDAPObject.delete_ext_s)
+  extop_s = _reconnect_sync_method(SimpleLDAPObject.extop_s)
+  modify_ext_s = _reconnect_sync_method(SimpleLDAPObject.modify_ext_s)
+  rename_s = _reconnect_sync_method(SimpleLDAPObject.rename_s)
+  search_ext_s = _reconnect_sync_method(SimpleLDAPObject.search_ext_s)
+  whoami_s = _reconnect_sync_method(SimpleLDAPObject.whoami_s)
 
 
 # The class called LDAPObject will be used as default for
@@ -18,8 +18,9 @@ def addModlist(entry,ignore_attr_types=None):
       # This attribute type is ignored
       continue
     # Eliminate empty attr value strings in list
-    attrvaluelist = [item for item in value if item is not None]
-    if attrvaluelist:
+    if None in value:
+      value = [item for item in value if item is not None]
+    if value:
       modlist.append((attrtype, value))
   return modlist # addModlist()
 
@@ -48,26 +49,28 @@ def modifyModlist(
   """
   ignore_attr_types = {v.lower() for v in ignore_attr_types or []}
   case_ignore_attr_types = {v.lower() for v in case_ignore_attr_types or []}
+  MOD_ADD = ldap.MOD_ADD
+  MOD_DELETE = ldap.MOD_DELETE
   modlist = []
-  attrtype_lower_map = {}
-  for a in old_entry:
-    attrtype_lower_map[a.lower()]=a
+  attrtype_lower_map = {a.lower(): a for a in old_entry}
   for attrtype, value in new_entry.items():
     attrtype_lower = attrtype.lower()
     if attrtype_lower in ignore_attr_types:
       # This attribute type is ignored
       continue
     # Filter away null-strings
-    new_value = [item for item in value if item is not None]
+    new_value = value
+    if None in new_value:
+      new_value = [item for item in new_value if item is not None]
     if attrtype_lower in attrtype_lower_map:
-      old_value = old_entry.get(attrtype_lower_map[attrtype_lower],[])
-      old_value = [item for item in old_value if item is not None]
-      del attrtype_lower_map[attrtype_lower]
+      old_value = old_entry.get(attrtype_lower_map.pop(attrtype_lower),[])
+      if None in old_value:
+        old_value = [item for item in old_value if item is not None]
     else:
       old_value = []
     if not old_value and new_value:
       # Add a new attribute to entry
-      modlist.append((ldap.MOD_ADD,attrtype,new_value))
+      modlist.append((MOD_ADD,attrtype,new_value))
     elif old_value and new_value:
       # Replace existing attribute
       replace_attr_value = len(old_value)!=len(new_value)
@@ -80,11 +83,11 @@ def modifyModlist(
           new_value_set = set(new_value)
         replace_attr_value = new_value_set != old_value_set
       if replace_attr_value:
-        modlist.append((ldap.MOD_DELETE,attrtype,None))
-        modlist.append((ldap.MOD_ADD,attrtype,new_value))
+        modlist.append((MOD_DELETE,attrtype,None))
+        modlist.append((MOD_ADD,attrtype,new_value))
     elif old_value and not new_value:
       # Completely delete an existing attribute
-      modlist.append((ldap.MOD_DELETE,attrtype,None))
+      modlist.append((MOD_DELETE,attrtype,None))
   if not ignore_oldexistent:
     # Remove all attributes of old_entry which are not present
     # in new_entry at all
@@ -93,5 +96,5 @@ def modifyModlist(
         # This attribute type is ignored
         continue
       attrtype = val
-      modlist.append((ldap.MOD_DELETE,attrtype,None))
+      modlist.append((MOD_DELETE,attrtype,None))
   return modlist # modifyModlist()
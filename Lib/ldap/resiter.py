@@ -17,25 +17,19 @@ class ResultProcessor:
         Generator function which returns an iterator for processing all LDAP operation
         results of the given msgid like retrieved with LDAPObject.result3() -> 4-tuple
         """
-        result_type, result_list, result_msgid, result_serverctrls, _, _ = \
-            self.result4(
-                msgid,
-                0,
-                timeout,
-                add_ctrls=add_ctrls
-            )
-        while result_type and result_list:
+        while True:
+            result_type, result_list, result_msgid, result_serverctrls = \
+                self.result4(
+                    msgid,
+                    0,
+                    timeout,
+                    add_ctrls=add_ctrls
+                )[:4]
+            if not (result_type and result_list):
+                return # allresults()
             yield (
                 result_type,
                 result_list,
                 result_msgid,
                 result_serverctrls
             )
-            result_type, result_list, result_msgid, result_serverctrls, _, _ = \
-                self.result4(
-                    msgid,
-                    0,
-                    timeout,
-                    add_ctrls=add_ctrls
-                )
-        return # allresults()
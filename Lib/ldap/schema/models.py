@@ -4,14 +4,12 @@ schema.py - support for subSchemaSubEntry information
 See https://www.python-ldap.org/ for details.
 """
 
-import sys
-
 import ldap.cidict
-from collections import UserDict
+from collections.abc import MutableMapping
 
 from ldap.schema.tokenizer import split_tokens,extract_tokens
 
-NOT_HUMAN_READABLE_LDAP_SYNTAXES = {
+NOT_HUMAN_READABLE_LDAP_SYNTAXES = frozenset({
   '1.3.6.1.4.1.1466.115.121.1.4',  # Audio
   '1.3.6.1.4.1.1466.115.121.1.5',  # Binary
   '1.3.6.1.4.1.1466.115.121.1.8',  # Certificate
@@ -21,7 +19,21 @@ NOT_HUMAN_READABLE_LDAP_SYNTAXES = {
   '1.3.6.1.4.1.1466.115.121.1.28', # JPEG
   '1.3.6.1.4.1.1466.115.121.1.40', # Octet String
   '1.3.6.1.4.1.1466.115.121.1.49', # Supported Algorithm
-}
+})
+
+# String representations of ObjectClass.kind and AttributeType.usage,
+# indexed by the integer values
+_OBJECTCLASS_KIND_STR = (
+  ' STRUCTURAL',
+  ' ABSTRACT',
+  ' AUXILIARY',
+)
+_ATTRIBUTETYPE_USAGE_STR = (
+  '',
+  ' USAGE directoryOperation',
+  ' USAGE distributedOperation',
+  ' USAGE dSAOperation',
+)
 
 
 class SchemaElement:
@@ -42,6 +54,7 @@ class SchemaElement:
     Dictionary internally used by the schema element parser
     containing the defaults for certain schema description key-words
   """
+  __slots__ = ('oid','desc')
   token_defaults = {
     'DESC':(None,),
   }
@@ -59,6 +72,23 @@ class SchemaElement:
     self.desc = d['DESC'][0]
     return
 
+  def __getstate__(self):
+    # Instances have no __dict__ because of __slots__, pickle protocols
+    # 0 and 1 need the state explicitly
+    state = {
+      name:getattr(self,name)
+      for cls in self.__class__.__mro__
+      for name in getattr(cls,'__slots__',())
+      if hasattr(self,name)
+    }
+    # Subclasses without __slots__ have a __dict__
+    state.update(getattr(self,'__dict__',{}))
+    return state
+
+  def __setstate__(self,state):
+    for name,value in state.items():
+      setattr(self,name,value)
+
   def set_id(self,element_id):
     self.oid = element_id
 
@@ -69,7 +99,9 @@ class SchemaElement:
     assert value is None or type(value)==str,TypeError("value has to be of str, was %r" % value)
     if value:
       if quoted:
-        return " {} '{}'".format(key,value.replace("'","\\'"))
+        if "'" in value:
+          value = value.replace("'","\\'")
+        return f" {key} '{value}'"
       else:
         return f" {key} {value}"
     else:
@@ -79,19 +111,23 @@ class SchemaElement:
     assert type(values)==tuple,TypeError("values has to be a tuple, was %r" % values)
     if not values:
       return ''
-    if quoted:
-      quoted_values = [ "'%s'" % value.replace("'","\\'") for value in values ]
-    else:
-      quoted_values = values
     if len(values)==1:
-      return ' {} {}'.format(key,quoted_values[0])
-    else:
-      return ' {} ( {} )'.format(key,sep.join(quoted_values))
+      # Most common case, avoids building a list
+      value = values[0]
+      if quoted:
+        if "'" in value:
+          value = value.replace("'","\\'")
+        return f" {key} '{value}'"
+      return f" {key} {value}"
+    if quoted:
+      values = [
+        "'%s'" % (value.replace("'","\\'") if "'" in value else value)
+        for value in values
+      ]
+    return f" {key} ( {sep.join(values)} )"
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    return '( %s )' % ''.join(result)
+    return f"( {self.oid}{self.key_attr('DESC',self.desc,quoted=1)} )"
 
 
 class ObjectClass(SchemaElement):
@@ -133,6 +169,7 @@ class ObjectClass(SchemaElement):
     implementations to indicate the source of the associated schema
     element
   """
+  __slots__ = ('names','obsolete','must','may','x_origin','kind','sup')
   schema_attribute = 'objectClasses'
   token_defaults = {
     'NAME':(()),
@@ -160,24 +197,27 @@ class ObjectClass(SchemaElement):
       self.kind = 1
     elif d['AUXILIARY']!=None:
       self.kind = 2
-    if self.kind==0 and not d['SUP'] and self.oid!='2.5.6.0':
+    sup = d['SUP']
+    if self.kind==0 and not sup and self.oid!='2.5.6.0':
       # STRUCTURAL object classes are sub-classes of 'top' by default
       self.sup = ('top',)
     else:
-      self.sup = d['SUP']
+      self.sup = sup
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append(self.key_list('SUP',self.sup,sep=' $ '))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append({0:' STRUCTURAL',1:' ABSTRACT',2:' AUXILIARY'}[self.kind])
-    result.append(self.key_list('MUST',self.must,sep=' $ '))
-    result.append(self.key_list('MAY',self.may,sep=' $ '))
-    result.append(self.key_list('X-ORIGIN',self.x_origin,quoted=1))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{self.key_list('SUP',self.sup,sep=' $ ')}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{_OBJECTCLASS_KIND_STR[self.kind]}"
+      f"{self.key_list('MUST',self.must,sep=' $ ')}"
+      f"{self.key_list('MAY',self.may,sep=' $ ')}"
+      f"{self.key_list('X-ORIGIN',self.x_origin,quoted=1)}"
+      " )"
+    )
 
 
 AttributeUsage = ldap.cidict.cidict({
@@ -188,6 +228,9 @@ AttributeUsage = ldap.cidict.cidict({
   'dSAOperation':3,
 })
 
+# Case-sensitive copy of AttributeUsage for the common exact-case lookup
+_ATTRIBUTE_USAGE = dict(AttributeUsage.items())
+
 
 class AttributeType(SchemaElement):
   """
@@ -240,6 +283,11 @@ class AttributeType(SchemaElement):
     implementations to indicate the source of the associated schema
     element
   """
+  __slots__ = (
+    'names','obsolete','sup','equality','ordering','substr','x_origin',
+    'x_ordered','syntax','syntax_len','single_value','collective',
+    'no_user_mod','usage',
+  )
   schema_attribute = 'attributeTypes'
   token_defaults = {
     'NAME':(()),
@@ -268,58 +316,57 @@ class AttributeType(SchemaElement):
     self.substr = d['SUBSTR'][0]
     self.x_origin = d['X-ORIGIN']
     self.x_ordered = d['X-ORDERED'][0]
-    try:
-      syntax = d['SYNTAX'][0]
-    except IndexError:
+    # SYNTAX without value results in an empty tuple
+    syntax = d['SYNTAX']
+    syntax = syntax[0] if syntax else None
+    if syntax is None:
       self.syntax = None
       self.syntax_len = None
     else:
-      if syntax is None:
-        self.syntax = None
+      try:
+        self.syntax,syntax_len = syntax.split("{")
+      except ValueError:
+        self.syntax = syntax
         self.syntax_len = None
+        # Length might be a separate token right after the SYNTAX value
+        i = l.index('SYNTAX')+2
+        if i<len(l) and l[i].startswith("{") and l[i].endswith("}"):
+          self.syntax_len = int(l[i][1:-1])
       else:
-        try:
-          self.syntax,syntax_len = d['SYNTAX'][0].split("{")
-        except ValueError:
-          self.syntax = d['SYNTAX'][0]
-          self.syntax_len = None
-          for i in l:
-            if i.startswith("{") and i.endswith("}"):
-              self.syntax_len = int(i[1:-1])
-        else:
-          self.syntax_len = int(syntax_len[:-1])
+        self.syntax_len = int(syntax_len[:-1])
     self.single_value = d['SINGLE-VALUE']!=None
     self.collective = d['COLLECTIVE']!=None
     self.no_user_mod = d['NO-USER-MODIFICATION']!=None
-    self.usage = AttributeUsage.get(d['USAGE'][0],0)
+    usage = d['USAGE'][0]
+    self.usage = _ATTRIBUTE_USAGE.get(usage)
+    if self.usage is None:
+      self.usage = AttributeUsage.get(usage,0)
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append(self.key_list('SUP',self.sup,sep=' $ '))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_attr('EQUALITY',self.equality))
-    result.append(self.key_attr('ORDERING',self.ordering))
-    result.append(self.key_attr('SUBSTR',self.substr))
-    result.append(self.key_attr('SYNTAX',self.syntax))
-    if self.syntax_len!=None:
-      result.append(('{%d}' % (self.syntax_len))*(self.syntax_len>0))
-    result.append({0:'',1:' SINGLE-VALUE'}[self.single_value])
-    result.append({0:'',1:' COLLECTIVE'}[self.collective])
-    result.append({0:'',1:' NO-USER-MODIFICATION'}[self.no_user_mod])
-    result.append(
-      {
-        0:"",
-        1:" USAGE directoryOperation",
-        2:" USAGE distributedOperation",
-        3:" USAGE dSAOperation",
-      }[self.usage]
+    if self.syntax_len is not None and self.syntax_len>0:
+      syntax_len = '{%d}' % (self.syntax_len)
+    else:
+      syntax_len = ''
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{self.key_list('SUP',self.sup,sep=' $ ')}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_attr('EQUALITY',self.equality)}"
+      f"{self.key_attr('ORDERING',self.ordering)}"
+      f"{self.key_attr('SUBSTR',self.substr)}"
+      f"{self.key_attr('SYNTAX',self.syntax)}"
+      f"{syntax_len}"
+      f"{' SINGLE-VALUE' if self.single_value else ''}"
+      f"{' COLLECTIVE' if self.collective else ''}"
+      f"{' NO-USER-MODIFICATION' if self.no_user_mod else ''}"
+      f"{_ATTRIBUTETYPE_USAGE_STR[self.usage]}"
+      f"{self.key_list('X-ORIGIN',self.x_origin,quoted=1)}"
+      f"{self.key_attr('X-ORDERED',self.x_ordered,quoted=1)}"
+      " )"
     )
-    result.append(self.key_list('X-ORIGIN',self.x_origin,quoted=1))
-    result.append(self.key_attr('X-ORDERED',self.x_ordered,quoted=1))
-    return '( %s )' % ''.join(result)
 
 
 class LDAPSyntax(SchemaElement):
@@ -334,6 +381,7 @@ class LDAPSyntax(SchemaElement):
     Integer flag (0 or 1) indicating whether the attribute type is marked
     as not human-readable (X-NOT-HUMAN-READABLE)
   """
+  __slots__ = ('x_subst','not_human_readable','x_binary_transfer_required')
   schema_attribute = 'ldapSyntaxes'
   token_defaults = {
     'DESC':(None,),
@@ -352,13 +400,17 @@ class LDAPSyntax(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append(self.key_attr('X-SUBST',self.x_subst,quoted=1))
-    result.append(
-      {0:'',1:" X-NOT-HUMAN-READABLE 'TRUE'"}[self.not_human_readable]
+    if self.not_human_readable:
+      not_human_readable = " X-NOT-HUMAN-READABLE 'TRUE'"
+    else:
+      not_human_readable = ''
+    return (
+      f"( {self.oid}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{self.key_attr('X-SUBST',self.x_subst,quoted=1)}"
+      f"{not_human_readable}"
+      " )"
     )
-    return '( %s )' % ''.join(result)
 
 
 class MatchingRule(SchemaElement):
@@ -383,6 +435,7 @@ class MatchingRule(SchemaElement):
     OID of the LDAP syntax this matching rule is usable with
     (string, or None if missing)
   """
+  __slots__ = ('names','obsolete','syntax')
   schema_attribute = 'matchingRules'
   token_defaults = {
     'NAME':(()),
@@ -399,12 +452,14 @@ class MatchingRule(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_attr('SYNTAX',self.syntax))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_attr('SYNTAX',self.syntax)}"
+      " )"
+    )
 
 
 class MatchingRuleUse(SchemaElement):
@@ -429,6 +484,7 @@ class MatchingRuleUse(SchemaElement):
     NAMEs or OIDs of attribute types for which this matching rule is used
     (tuple of strings)
   """
+  __slots__ = ('names','obsolete','applies')
   schema_attribute = 'matchingRuleUse'
   token_defaults = {
     'NAME':(()),
@@ -445,12 +501,14 @@ class MatchingRuleUse(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_list('APPLIES',self.applies,sep=' $ '))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_list('APPLIES',self.applies,sep=' $ ')}"
+      " )"
+    )
 
 
 class DITContentRule(SchemaElement):
@@ -489,6 +547,7 @@ class DITContentRule(SchemaElement):
     NAMEs or OIDs of attributes which may not be present in an entry of the
     object class. (tuple of strings)
   """
+  __slots__ = ('names','obsolete','aux','must','may','nots')
   schema_attribute = 'dITContentRules'
   token_defaults = {
     'NAME':(()),
@@ -511,15 +570,17 @@ class DITContentRule(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_list('AUX',self.aux,sep=' $ '))
-    result.append(self.key_list('MUST',self.must,sep=' $ '))
-    result.append(self.key_list('MAY',self.may,sep=' $ '))
-    result.append(self.key_list('NOT',self.nots,sep=' $ '))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_list('AUX',self.aux,sep=' $ ')}"
+      f"{self.key_list('MUST',self.must,sep=' $ ')}"
+      f"{self.key_list('MAY',self.may,sep=' $ ')}"
+      f"{self.key_list('NOT',self.nots,sep=' $ ')}"
+      " )"
+    )
 
 
 class DITStructureRule(SchemaElement):
@@ -547,6 +608,7 @@ class DITStructureRule(SchemaElement):
     NAMEs or OIDs of allowed structural object classes
     of superior entries in the DIT (tuple of strings)
   """
+  __slots__ = ('ruleid','names','obsolete','form','sup')
   schema_attribute = 'dITStructureRules'
 
   token_defaults = {
@@ -572,13 +634,15 @@ class DITStructureRule(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.ruleid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_attr('FORM',self.form,quoted=0))
-    result.append(self.key_list('SUP',self.sup,sep=' $ '))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.ruleid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_attr('FORM',self.form,quoted=0)}"
+      f"{self.key_list('SUP',self.sup,sep=' $ ')}"
+      " )"
+    )
 
 
 class NameForm(SchemaElement):
@@ -610,6 +674,7 @@ class NameForm(SchemaElement):
     NAMEs or OIDs of additional attributes an RDN may contain
     (tuple of strings)
   """
+  __slots__ = ('names','obsolete','oc','must','may')
   schema_attribute = 'nameForms'
   token_defaults = {
     'NAME':(()),
@@ -630,17 +695,19 @@ class NameForm(SchemaElement):
     return
 
   def __str__(self):
-    result = [str(self.oid)]
-    result.append(self.key_list('NAME',self.names,quoted=1))
-    result.append(self.key_attr('DESC',self.desc,quoted=1))
-    result.append({0:'',1:' OBSOLETE'}[self.obsolete])
-    result.append(self.key_attr('OC',self.oc))
-    result.append(self.key_list('MUST',self.must,sep=' $ '))
-    result.append(self.key_list('MAY',self.may,sep=' $ '))
-    return '( %s )' % ''.join(result)
+    return (
+      f"( {self.oid}"
+      f"{self.key_list('NAME',self.names,quoted=1)}"
+      f"{self.key_attr('DESC',self.desc,quoted=1)}"
+      f"{' OBSOLETE' if self.obsolete else ''}"
+      f"{self.key_attr('OC',self.oc)}"
+      f"{self.key_list('MUST',self.must,sep=' $ ')}"
+      f"{self.key_list('MAY',self.may,sep=' $ ')}"
+      " )"
+    )
 
 
-class Entry(UserDict):
+class Entry(MutableMapping):
   """
   Schema-aware implementation of an LDAP entry class.
 
@@ -653,7 +720,7 @@ class Entry(UserDict):
     self._attrtype2keytuple = {}
     self._s = schema
     self.dn = dn
-    super().__init__()
+    self.data = {}
     self.update(entry)
 
   def _at2key(self,nameoroid):
@@ -661,21 +728,28 @@ class Entry(UserDict):
     Return tuple of OID and all sub-types of attribute type specified
     in nameoroid.
     """
-    try:
+    t = self._attrtype2keytuple.get(nameoroid)
+    if t is not None:
       # Mapping already in cache
-      return self._attrtype2keytuple[nameoroid]
-    except KeyError:
-      # Mapping has to be constructed
-      oid = self._s.getoid(ldap.schema.AttributeType,nameoroid)
-      l = nameoroid.lower().split(';')
-      l[0] = oid
-      t = tuple(l)
-      self._attrtype2keytuple[nameoroid] = t
       return t
+    # Mapping has to be constructed
+    oid = self._s.getoid(ldap.schema.AttributeType,nameoroid)
+    l = nameoroid.lower().split(';')
+    l[0] = oid
+    t = tuple(l)
+    self._attrtype2keytuple[nameoroid] = t
+    return t
 
   def update(self,dict):
+    # Same as calling __setitem__() for each item but without
+    # the per-item method call overhead
+    at2key = self._at2key
+    keytuple2attrtype = self._keytuple2attrtype
+    data = self.data
     for key, value in dict.items():
-      self[key] = value
+      k = at2key(key)
+      keytuple2attrtype[k] = key
+      data[k] = value
 
   def __contains__(self,nameoroid):
     return self._at2key(nameoroid) in self.data
@@ -694,6 +768,29 @@ class Entry(UserDict):
     del self._attrtype2keytuple[nameoroid]
     del self._keytuple2attrtype[k]
 
+  def __iter__(self):
+    return iter(self._keytuple2attrtype.values())
+
+  def __len__(self):
+    return len(self.data)
+
+  def __repr__(self):
+    return repr(self.data)
+
+  def copy(self):
+    """
+    Return a shallow copy of this entry which does not share any of
+    its internal dictionaries with the original
+    """
+    entry = self.__class__.__new__(self.__class__)
+    entry.__dict__.update(self.__dict__)
+    entry._keytuple2attrtype = self._keytuple2attrtype.copy()
+    entry._attrtype2keytuple = self._attrtype2keytuple.copy()
+    entry.data = self.data.copy()
+    return entry
+
+  __copy__ = copy
+
   def has_key(self,nameoroid):
     k = self._at2key(nameoroid)
     return k in self.data
@@ -702,9 +799,10 @@ class Entry(UserDict):
     return self._keytuple2attrtype.values()
 
   def items(self):
+    data = self.data
     return [
-      (k,self[k])
-      for k in self.keys()
+      (attrtype,data[k])
+      for k,attrtype in self._keytuple2attrtype.items()
     ]
 
   def attribute_types(
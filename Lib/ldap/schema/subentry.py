@@ -5,6 +5,7 @@ See https://www.python-ldap.org/ for details.
 """
 
 import copy
+from collections import deque
 from urllib.request import urlopen
 
 import ldap.cidict,ldap.schema
@@ -91,25 +92,32 @@ class SubSchema:
       self.sed[c] = {}
       self.non_unique_names[c] = ldap.cidict.cidict()
 
-    # Transform entry dict to case-insensitive dict
-    e = ldap.cidict.cidict(sub_schema_sub_entry)
+    # Transform entry dict to case-insensitive dict, it's only read
+    # so an already case-insensitive dict can be used directly
+    if isinstance(sub_schema_sub_entry,ldap.cidict.cidict):
+      e = sub_schema_sub_entry
+    else:
+      e = ldap.cidict.cidict(sub_schema_sub_entry)
 
     # Build the schema registry in dictionaries
     for attr_type in SCHEMA_ATTRS:
 
+      se_class = SCHEMA_CLASS_MAPPING[attr_type]
+      se_registry = self.sed[se_class]
+      se_name2oid = self.name2oid[se_class]
+
       for attr_value in filter(None,e.get(attr_type,[])):
 
-        se_class = SCHEMA_CLASS_MAPPING[attr_type]
         se_instance = se_class(attr_value)
         se_id = se_instance.get_id()
 
-        if check_uniqueness and se_id in self.sed[se_class]:
+        if check_uniqueness and se_id in se_registry:
             self.non_unique_oids[se_id] = None
             if check_uniqueness==1:
               # Add to subschema by adding suffix to ID
               suffix_counter = 1
               new_se_id = se_id
-              while new_se_id in self.sed[se_class]:
+              while new_se_id in se_registry:
                 new_se_id = ';'.join((se_id,str(suffix_counter)))
                 suffix_counter += 1
               else:
@@ -118,15 +126,20 @@ class SubSchema:
               raise OIDNotUnique(attr_value)
 
         # Store the schema element instance in the central registry
-        self.sed[se_class][se_id] = se_instance
-
-        if hasattr(se_instance,'names'):
-          for name in ldap.cidict.cidict({}.fromkeys(se_instance.names)):
-            if check_uniqueness and name in self.name2oid[se_class]:
+        se_registry[se_id] = se_instance
+
+        se_names = getattr(se_instance,'names',None)
+        if se_names:
+          # Lower-cased NAMEs already registered for this element,
+          # a NAME repeated within the same element is not a conflict
+          se_names_seen = set()
+          for name in se_names:
+            name_lower = name.lower()
+            if check_uniqueness and name_lower not in se_names_seen and name in se_name2oid:
               self.non_unique_names[se_class][se_id] = None
               raise NameNotUnique(attr_value)
-            else:
-              self.name2oid[se_class][name] = se_id
+            se_names_seen.add(name_lower)
+            se_name2oid[name] = se_id
 
     # Turn dict into list maybe more handy for applications
     self.non_unique_oids = list(self.non_unique_oids)
@@ -178,6 +191,7 @@ class SubSchema:
     """
     assert schema_element_class in [ObjectClass,AttributeType]
     avail_se = self.listall(schema_element_class,schema_element_filters)
+    se_registry = self.sed[schema_element_class]
     top_node = '_'
     tree = ldap.cidict.cidict({top_node:[]})
     # 1. Pass: Register all nodes
@@ -185,20 +199,17 @@ class SubSchema:
       tree[se] = []
     # 2. Pass: Register all sup references
     for se_oid in avail_se:
-      se_obj = self.get_obj(schema_element_class,se_oid,None)
+      # se_oid was taken from the registry, no need for get_obj()
+      se_obj = se_registry[se_oid]
       if se_obj.__class__!=schema_element_class:
         # Ignore schema elements not matching schema_element_class.
         # This helps with falsely assigned OIDs.
         continue
-      assert se_obj.__class__==schema_element_class, \
-        "Schema element referenced by {} must be of class {} but was {}".format(
-          se_oid,schema_element_class.__name__,se_obj.__class__
-        )
       for s in se_obj.sup or ('_',):
         sup_oid = self.getoid(schema_element_class,s)
         try:
           tree[sup_oid].append(se_oid)
-        except:
+        except KeyError:
           pass
     return tree
 
@@ -288,25 +299,24 @@ class SubSchema:
     Returns OID of structural object class in oc_list
     if any is present. Returns None else.
     """
-    # Get tree of all STRUCTURAL object classes
-    oc_tree = self.tree(ObjectClass,[('kind',[0])])
     # Filter all STRUCTURAL object classes
     struct_ocs = {}
     for oc_nameoroid in oc_list:
       oc_se = self.get_obj(ObjectClass,oc_nameoroid,None)
       if oc_se and oc_se.kind==0:
-        struct_ocs[oc_se.oid] = None
-    result = None
-    # Build a copy of the oid list, to be cleaned as we go.
-    struct_oc_list = list(struct_ocs)
-    while struct_oc_list:
-      oid = struct_oc_list.pop()
-      for child_oid in oc_tree[oid]:
-        if self.getoid(ObjectClass,child_oid) in struct_ocs:
-          break
-      else:
-        result = oid
-    return result
+        struct_ocs[oc_se.oid] = oc_se
+    # Collect the direct superiors of these object classes instead of
+    # building the tree of all STRUCTURAL object classes
+    sup_oids = {
+      self.getoid(ObjectClass,s)
+      for oc_se in struct_ocs.values()
+      for s in oc_se.sup
+    }
+    # Return the first one which has no sub-class in oc_list
+    for oid in struct_ocs:
+      if oid not in sup_oids:
+        return oid
+    return None
 
 
   def get_applicable_aux_classes(self,nameoroid):
@@ -350,29 +360,30 @@ class SubSchema:
     AttributeType = ldap.schema.AttributeType
     ObjectClass = ldap.schema.ObjectClass
 
-    # Map object_class_list to object_class_oids (list of OIDs)
-    object_class_oids = [
+    # Map object_class_list to object_class_oids (queue of OIDs)
+    object_class_oids = deque([
       self.getoid(ObjectClass,o)
       for o in object_class_list
-    ]
+    ])
     # Initialize
-    oid_cache = {}
+    oid_cache = set()
+    at_sed = self.sed[AttributeType]
 
     r_must,r_may = ldap.cidict.cidict(),ldap.cidict.cidict()
     if '1.3.6.1.4.1.1466.101.120.111' in object_class_oids:
       # Object class 'extensibleObject' MAY carry every attribute type
-      for at_obj in self.sed[AttributeType].values():
+      for at_obj in at_sed.values():
         r_may[at_obj.oid] = at_obj
 
     # Loop over OIDs of all given object classes
     while object_class_oids:
-      object_class_oid = object_class_oids.pop(0)
+      object_class_oid = object_class_oids.popleft()
       # Check whether the objectClass with this OID
       # has already been processed
       if object_class_oid in oid_cache:
         continue
       # Cache this OID as already being processed
-      oid_cache[object_class_oid] = None
+      oid_cache.add(object_class_oid)
       try:
         object_class = self.sed[ObjectClass][object_class_oid]
       except KeyError:
@@ -380,15 +391,12 @@ class SubSchema:
           raise
         # Ignore this object class
         continue
-      assert isinstance(object_class,ObjectClass)
-      assert hasattr(object_class,'must'),ValueError(object_class_oid)
-      assert hasattr(object_class,'may'),ValueError(object_class_oid)
       for a in object_class.must:
         se_oid = self.getoid(AttributeType,a,raise_keyerror=raise_keyerror)
-        r_must[se_oid] = self.get_obj(AttributeType,se_oid,raise_keyerror=raise_keyerror)
+        r_must[se_oid] = at_sed.get(se_oid)
       for a in object_class.may:
         se_oid = self.getoid(AttributeType,a,raise_keyerror=raise_keyerror)
-        r_may[se_oid] = self.get_obj(AttributeType,se_oid,raise_keyerror=raise_keyerror)
+        r_may[se_oid] = at_sed.get(se_oid)
 
       object_class_oids.extend([
         self.getoid(ObjectClass,o)
@@ -408,10 +416,10 @@ class SubSchema:
         else:
           for a in dit_content_rule.must:
             se_oid = self.getoid(AttributeType,a,raise_keyerror=raise_keyerror)
-            r_must[se_oid] = self.get_obj(AttributeType,se_oid,raise_keyerror=raise_keyerror)
+            r_must[se_oid] = at_sed.get(se_oid)
           for a in dit_content_rule.may:
             se_oid = self.getoid(AttributeType,a,raise_keyerror=raise_keyerror)
-            r_may[se_oid] = self.get_obj(AttributeType,se_oid,raise_keyerror=raise_keyerror)
+            r_may[se_oid] = at_sed.get(se_oid)
           for a in dit_content_rule.nots:
             a_oid = self.getoid(AttributeType,a,raise_keyerror=raise_keyerror)
             try:
@@ -485,9 +493,9 @@ def urlfetch(uri,trace_level=0):
   s_temp = s_temp or {}
   for at,av in s_temp.items():
     if at in SCHEMA_CLASS_MAPPING:
-      try:
+      if at in subschemasubentry_entry:
         subschemasubentry_entry[at].extend(av)
-      except KeyError:
+      else:
         subschemasubentry_entry[at] = av
   # Finally parse the schema
   if subschemasubentry_dn!=None:
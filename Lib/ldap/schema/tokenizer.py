@@ -34,7 +34,10 @@ def split_tokens(s):
         if unquoted:
             parts.append(unquoted)
         elif quoted:
-            parts.append(UNESCAPE_PATTERN.sub(r'\1', quoted[1:-1]))
+            quoted = quoted[1:-1]
+            if '\\' in quoted:
+                quoted = UNESCAPE_PATTERN.sub(r'\1', quoted)
+            parts.append(quoted)
         elif opar:
             parens += 1
             parts.append(opar)
@@ -55,13 +58,14 @@ def extract_tokens(l,known_tokens):
   Returns dictionary of known tokens with all values
   """
   assert l[0].strip()=="(" and l[-1].strip()==")",ValueError(l)
-  result = {}
-  result.update(known_tokens)
+  # Start with a copy of the defaults, its keys are also
+  # used for recognizing known tokens below
+  result = dict(known_tokens)
   i = 0
   l_len = len(l)
   while i<l_len:
-    if l[i] in result:
-      token = l[i]
+    token = l[i]
+    if token in result:
       i += 1 # Consume token
       if i<l_len:
         if l[i] in result:
@@ -71,9 +75,12 @@ def extract_tokens(l,known_tokens):
           # multi-valued
           i += 1 # Consume left parentheses
           start = i
-          while i<l_len and l[i]!=")":
-            i += 1
-          result[token] = tuple(filter(lambda v:v!='$',l[start:i]))
+          try:
+            i = l.index(")",start)
+          except ValueError:
+            # Only possible if the assertion above was skipped (python -O)
+            raise ValueError("Unbalanced parenthesis in %r" % (l,))
+          result[token] = tuple([v for v in l[start:i] if v!='$'])
           i += 1 # Consume right parentheses
         else:
           # single-valued
@@ -413,11 +413,12 @@ class SyncreplConsumer:
                 # look for a SyncDone control, save the cookie, and if necessary
                 # delete non-present entries.
                 for c in ctrls:
-                    if c.__class__.__name__ != 'SyncDoneControl':
+                    if not isinstance(c, SyncDoneControl):
                         continue
                     self.syncrepl_present(None, refreshDeletes=c.refreshDeletes)
                     if c.cookie is not None:
                         self.syncrepl_set_cookie(c.cookie)
+                    break
 
                 return False
 
@@ -426,7 +427,7 @@ class SyncreplConsumer:
                 for m in msg:
                     dn, attrs, ctrls = m
                     for c in ctrls:
-                        if c.__class__.__name__ != 'SyncStateControl':
+                        if not isinstance(c, SyncStateControl):
                             continue
                         if c.state == 'present':
                             self.syncrepl_present([c.entryUUID])
@@ -46,16 +46,28 @@ SEARCH_SCOPE = {
 StringType = type('')
 TupleType=type(())
 
+# URL schemes accepted by LDAPUrl
+_LDAP_URL_SCHEMES = frozenset(('ldap','ldaps','ldapi'))
+
+# Characters never touched by ldapUrlEscape()
+_URL_SAFE_CHARS = frozenset(
+  'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~'
+)
+
 
 def isLDAPUrl(s):
   """Returns True if s is a LDAP URL, else False
   """
-  return s.lower().startswith(('ldap://', 'ldaps://', 'ldapi://'))
+  # Only the longest possible scheme prefix has to be lower-cased
+  return s[:8].lower().startswith(('ldap://', 'ldaps://', 'ldapi://'))
 
 
 def ldapUrlEscape(s):
   """Returns URL encoding of string s"""
-  return quote(s).replace(',','%2C').replace('/','%2F')
+  if _URL_SAFE_CHARS.issuperset(s):
+    return s
+  # With an empty safe set quote() also escapes '/' (and ',' anyway)
+  return quote(s,safe='')
 
 class LDAPUrlExtension:
   """
@@ -109,21 +121,19 @@ class LDAPUrlExtension:
     return self.unparse()
 
   def __repr__(self):
-    return '<{}.{} instance at {}: {}>'.format(
+    return '<%s.%s instance at %#x: %r>' % (
       self.__class__.__module__,
       self.__class__.__name__,
-      hex(id(self)),
+      id(self),
       self.__dict__
     )
 
   def __eq__(self,other):
+    if not isinstance(other, LDAPUrlExtension):
+      return NotImplemented
     return \
-      (self.critical==other.critical) and \
-      (self.extype==other.extype) and \
-      (self.exvalue==other.exvalue)
-
-  def __ne__(self,other):
-    return not self.__eq__(other)
+      (self.critical,self.extype,self.exvalue) == \
+      (other.critical,other.extype,other.exvalue)
 
 
 class LDAPUrlExtensions(MutableMapping):
@@ -171,10 +181,10 @@ class LDAPUrlExtensions(MutableMapping):
         return ','.join(str(v) for v in self.values())
 
     def __repr__(self):
-        return '<{}.{} instance at {}: {}>'.format(
+        return '<%s.%s instance at %#x: %r>' % (
             self.__class__.__module__,
             self.__class__.__name__,
-            hex(id(self)),
+            id(self),
             self._data
         )
 
@@ -245,51 +255,33 @@ class LDAPUrl:
       self.cred = cred
 
   def __eq__(self,other):
-    return \
-      self.urlscheme==other.urlscheme and \
-      self.hostport==other.hostport and \
-      self.dn==other.dn and \
-      self.attrs==other.attrs and \
-      self.scope==other.scope and \
-      self.filterstr==other.filterstr and \
-      self.extensions==other.extensions
-
-  def __ne__(self,other):
-    return not self.__eq__(other)
+    if not isinstance(other, LDAPUrl):
+      return NotImplemented
+    return (
+      self.urlscheme,self.hostport,self.dn,self.attrs,
+      self.scope,self.filterstr,self.extensions
+    ) == (
+      other.urlscheme,other.hostport,other.dn,other.attrs,
+      other.scope,other.filterstr,other.extensions
+    )
 
   def _parse(self,ldap_url):
     """
     parse a LDAP URL and set the class attributes
     urlscheme,host,dn,attrs,scope,filterstr,extensions
     """
-    if not isLDAPUrl(ldap_url):
+    scheme,sep,rest = ldap_url.partition('://')
+    scheme = scheme.lower()
+    if not sep or scheme not in _LDAP_URL_SCHEMES:
       raise ValueError('Value %s for ldap_url does not seem to be a LDAP URL.' % (repr(ldap_url)))
-    scheme,rest = ldap_url.split('://',1)
-    self.urlscheme = scheme.lower()
-    slash_pos = rest.find('/')
-    qemark_pos = rest.find('?')
-    if (slash_pos==-1) and (qemark_pos==-1):
-      # No / and ? found at all
-      self.hostport = unquote(rest)
-      self.dn = ''
-      return
-    else:
-      if slash_pos!=-1 and (qemark_pos==-1 or (slash_pos<qemark_pos)):
-        # Slash separates DN from hostport
-        self.hostport = unquote(rest[:slash_pos])
-        # Eat the slash from rest
-        rest = rest[slash_pos+1:]
-      elif qemark_pos!=1 and (slash_pos==-1 or (slash_pos>qemark_pos)):
-        # Question mark separates hostport from rest, DN is assumed to be empty
-        self.hostport = unquote(rest[:qemark_pos])
-        # Do not eat question mark
-        rest = rest[qemark_pos:]
-      else:
-        raise ValueError('Something completely weird happened!')
-    paramlist=rest.split('?',4)
+    self.urlscheme = scheme
+    paramlist = rest.split('?',4)
     paramlist_len = len(paramlist)
-    if paramlist_len>=1:
-      self.dn = unquote(paramlist[0]).strip()
+    # A slash in the first field separates DN from hostport,
+    # without one the DN is assumed to be empty
+    hostport,_,dn = paramlist[0].partition('/')
+    self.hostport = unquote(hostport)
+    self.dn = unquote(dn).strip()
     if (paramlist_len>=2) and (paramlist[1]):
       self.attrs = unquote(paramlist[1].strip()).split(',')
     if paramlist_len>=3:
@@ -396,10 +388,10 @@ class LDAPUrl:
     return self.unparse()
 
   def __repr__(self):
-    return '<{}.{} instance at {}: {}>'.format(
+    return '<%s.%s instance at %#x: %r>' % (
       self.__class__.__module__,
       self.__class__.__name__,
-      hex(id(self)),
+      id(self),
       self.__dict__
     )
 
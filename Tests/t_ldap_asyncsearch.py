@@ -19,6 +19,31 @@ class TestLdapAsyncSearch(unittest.TestCase):
         diff = set(dir(ldap.asyncsearch)).difference(dir(old))
         self.assertEqual(diff, set())
 
+    def test_wrong_result_type_str(self):
+        exc = ldap.asyncsearch.WrongResultType(105, frozenset({115, 100, 101}))
+        self.assertEqual(
+            str(exc),
+            'Received wrong result type 105 (expected one of 100, 101, 115).'
+        )
+        # The order of the expected result types does not matter
+        self.assertEqual(
+            str(ldap.asyncsearch.WrongResultType(105, [101, 115, 100])),
+            str(exc)
+        )
+        exc = ldap.asyncsearch.WrongResultType(
+            ldap.RES_ADD, ldap.asyncsearch.SEARCH_RESULT_TYPES
+        )
+        self.assertEqual(
+            str(exc),
+            'Received wrong result type {} (expected one of {}).'.format(
+                ldap.RES_ADD,
+                ', '.join(
+                    str(t)
+                    for t in sorted(ldap.asyncsearch.SEARCH_RESULT_TYPES)
+                ),
+            )
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
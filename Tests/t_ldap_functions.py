@@ -26,6 +26,7 @@ class TestFunction(unittest.TestCase):
         """
         self.assertEqual(ldap.strf_secs(0), '19700101000000Z')
         self.assertEqual(ldap.strf_secs(1466947067), '20160626131747Z')
+        self.assertEqual(ldap.strf_secs(-30641662555), '09990102030405Z')
 
     def test_ldap_strp_secs(self):
         """
@@ -34,6 +34,17 @@ class TestModlist(unittest.TestCase):
                 ('dummy3',[b'']),
             ]
         ),
+        (
+            {
+                'objectClass': [b'person'],
+                'cn':[None,b'Michael Stroeder'],
+                'sn':[None],
+            },
+            [
+                ('objectClass',[b'person']),
+                ('cn',[b'Michael Stroeder']),
+            ]
+        ),
     ]
 
     def test_addModlist(self):
@@ -4,7 +4,9 @@ Automatic tests for python-ldap's class ldap.schema.SubSchema
 See https://www.python-ldap.org/ for details.
 """
 
+import copy
 import os
+import pickle
 import unittest
 
 # Switch off processing .ldaprc or ldap.conf before importing _ldap
@@ -14,7 +16,7 @@ import ldap
 import ldif
 from ldap.ldapobject import SimpleLDAPObject
 import ldap.schema
-from ldap.schema.models import ObjectClass, AttributeType
+from ldap.schema.models import ObjectClass, AttributeType, Entry
 from slapdtest import SlapdTestCase, requires_ldapi
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -25,6 +27,10 @@ TEST_SUBSCHEMA_FILES = (
 )
 
 
+class MyAttributeType(AttributeType):
+    """Subclass without __slots__, instances have a __dict__"""
+
+
 class TestSubschemaLDIF(unittest.TestCase):
     """
     test ldap.schema.SubSchema with subschema subentries read from LDIF files
@@ -48,6 +54,67 @@ class TestSubschemaLDIF(unittest.TestCase):
                 for oid, attributetype in may.items():
                     self.assertEqual(attributetype.oid, oid)
 
+    def test_getoid_after_edit(self):
+        # Lookups must follow edits of the name registry
+        _, sub_schema = ldap.schema.urlfetch(
+            'file://{}'.format(TEST_SUBSCHEMA_FILES[1])
+        )
+        self.assertEqual(
+            sub_schema.getoid(AttributeType, 'cn;lang-en'), '2.5.4.3'
+        )
+        sub_schema.name2oid[AttributeType]['cn'] = '2.5.4.4'
+        self.assertEqual(
+            sub_schema.getoid(AttributeType, 'cn;lang-en'), '2.5.4.4'
+        )
+        del sub_schema.name2oid[AttributeType]['cn']
+        self.assertEqual(sub_schema.getoid(AttributeType, 'cn'), 'cn')
+        with self.assertRaises(KeyError):
+            sub_schema.getoid(AttributeType, 'cn', raise_keyerror=1)
+
+    def test_inheritedattr_after_edit(self):
+        # Schema elements are mutable, inherited values must follow edits
+        _, sub_schema = ldap.schema.urlfetch(
+            'file://{}'.format(TEST_SUBSCHEMA_FILES[1])
+        )
+        self.assertEqual(
+            sub_schema.get_inheritedattr(AttributeType, 'cn', 'equality'),
+            'caseIgnoreMatch'
+        )
+        sub_schema.get_obj(AttributeType, 'name').equality = 'caseExactMatch'
+        self.assertEqual(
+            sub_schema.get_inheritedattr(AttributeType, 'cn', 'equality'),
+            'caseExactMatch'
+        )
+        self.assertEqual(
+            sub_schema.get_inheritedobj(
+                AttributeType, 'cn', ['equality']
+            ).equality,
+            'caseExactMatch'
+        )
+
+    def test_structural_oc_after_edit(self):
+        # Results must follow edits of object class kind
+        _, sub_schema = ldap.schema.urlfetch(
+            'file://{}'.format(TEST_SUBSCHEMA_FILES[1])
+        )
+        posix_account = sub_schema.getoid(ObjectClass, 'posixAccount')
+        self.assertEqual(
+            sub_schema.get_structural_oc(['inetOrgPerson', 'person']),
+            '2.16.840.1.113730.3.2.2'
+        )
+        self.assertIn(
+            posix_account, sub_schema.get_applicable_aux_classes('person')
+        )
+        sub_schema.get_obj(ObjectClass, 'inetOrgPerson').kind = 2
+        sub_schema.get_obj(ObjectClass, 'posixAccount').kind = 0
+        self.assertEqual(
+            sub_schema.get_structural_oc(['inetOrgPerson', 'person']),
+            '2.5.6.6'
+        )
+        self.assertNotIn(
+            posix_account, sub_schema.get_applicable_aux_classes('person')
+        )
+
 
 class TestSubschemaUrlfetch(unittest.TestCase):
     def test_urlfetch_file(self):
@@ -184,6 +251,25 @@ class TestAttributes(unittest.TestCase):
         self.assertEqual(attr.sup, ())
         self.assertEqual(attr.x_origin, ())
 
+    def test_attributetype_syntax_len(self):
+        """Check parsing of the optional length of SYNTAX"""
+        for schema_element_str, syntax, syntax_len in (
+            ("( 2.999 )", None, None),
+            ("( 2.999 SYNTAX 1.3.6.1.4.1.1466.115.121.1.15 )",
+             '1.3.6.1.4.1.1466.115.121.1.15', None),
+            ("( 2.999 SYNTAX 1.3.6.1.4.1.1466.115.121.1.15{64} )",
+             '1.3.6.1.4.1.1466.115.121.1.15', 64),
+            ("( 2.999 SYNTAX 1.3.6.1.4.1.1466.115.121.1.15 {64} )",
+             '1.3.6.1.4.1.1466.115.121.1.15', 64),
+            ("( 2.999 DESC '{32}' SYNTAX 1.3.6.1.4.1.1466.115.121.1.15 {64} )",
+             '1.3.6.1.4.1.1466.115.121.1.15', 64),
+            ("( 2.999 SYNTAX 1.3.6.1.4.1.1466.115.121.1.15 DESC '{32}' )",
+             '1.3.6.1.4.1.1466.115.121.1.15', None),
+        ):
+            attr = AttributeType(schema_element_str)
+            self.assertEqual(attr.syntax, syntax)
+            self.assertEqual(attr.syntax_len, syntax_len)
+
     def test_empty_objectclass_attrs(self):
         """Check types and values of attributes of a minimal ObjectClass"""
         # (OID 2.999 is actually "/Example", for use in documentation)
@@ -235,6 +321,76 @@ class TestAttributes(unittest.TestCase):
         self.assertEqual(cls.sup, ('top',))
         self.assertEqual(cls.x_origin, ('RFC 4519',))
 
+    def test_pickle(self):
+        schema = self.get_schema()
+        for se_class in ldap.schema.SCHEMA_CLASS_MAPPING.values():
+            for se_oid in schema.listall(se_class)[:5]:
+                se = schema.get_obj(se_class, se_oid)
+                for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                    se_copy = pickle.loads(pickle.dumps(se, protocol))
+                    self.assertIs(se_copy.__class__, se.__class__)
+                    self.assertEqual(se_copy.__getstate__(), se.__getstate__())
+                    self.assertEqual(str(se_copy), str(se))
+
+    def test_pickle_subclass(self):
+        attr = MyAttributeType("( 2.999 NAME 'foo' )")
+        attr.comment = 'bar'
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            attr_copy = pickle.loads(pickle.dumps(attr, protocol))
+            self.assertEqual(attr_copy.names, ('foo',))
+            self.assertEqual(attr_copy.comment, 'bar')
+
+
+class TestEntry(unittest.TestCase):
+    def get_entry(self):
+        dn, schema = ldap.schema.urlfetch(
+            'file://{}'.format(TEST_SUBSCHEMA_FILES[1])
+        )
+        return Entry(
+            schema,
+            'cn=Foo,dc=example,dc=com',
+            {'objectClass': ['person'], 'cn': [b'Foo'], 'sn': [b'Bar']},
+        )
+
+    def test_lookup(self):
+        entry = self.get_entry()
+        self.assertEqual(entry['commonName'], [b'Foo'])
+        self.assertEqual(entry['2.5.4.3'], [b'Foo'])
+        self.assertIn('CN', entry)
+        self.assertNotIn('mail', entry)
+        self.assertEqual(entry.get('mail'), None)
+
+    def test_mapping(self):
+        entry = self.get_entry()
+        self.assertEqual(len(entry), 3)
+        self.assertEqual(sorted(entry), ['cn', 'objectClass', 'sn'])
+        self.assertEqual(sorted(entry.keys()), sorted(entry))
+        self.assertEqual(entry.pop('surname'), [b'Bar'])
+        self.assertEqual(sorted(entry), ['cn', 'objectClass'])
+        entry.clear()
+        self.assertEqual(len(entry), 0)
+        self.assertEqual(list(entry), [])
+
+    def test_copy(self):
+        entry = self.get_entry()
+        entry_copy = entry.copy()
+        self.assertIsInstance(entry_copy, Entry)
+        self.assertEqual(entry_copy.dn, entry.dn)
+        self.assertEqual(dict(entry_copy.items()), dict(entry.items()))
+        # Changes of the copy must not leak into the original
+        entry_copy['mail'] = [b'foo@example.com']
+        del entry_copy['sn']
+        self.assertEqual(sorted(entry_copy), ['cn', 'mail', 'objectClass'])
+        self.assertEqual(sorted(entry), ['cn', 'objectClass', 'sn'])
+        self.assertNotIn('mail', entry)
+        self.assertEqual(entry['sn'], [b'Bar'])
+        self.assertEqual(sorted(copy.copy(entry)), sorted(entry))
+
+    def test_repr(self):
+        entry = self.get_entry()
+        self.assertEqual(repr(entry), repr(entry.data))
+        self.assertIn("('2.5.4.3',): [b'Foo']", repr(entry))
+
 
 class TestSubschemaUrlfetchSlapd(SlapdTestCase):
     ldap_object_class = SimpleLDAPObject
@@ -626,6 +626,15 @@ class Test01_ReconnectLDAPObject(Test00_SimpleLDAPObject):
         l2 = pickle.loads(l1_state)
         self.assertEqual(l2.whoami_s(), 'dn:'+bind_dn)
 
+    def test104_reconnect_restore_unbound(self):
+        l1 = self.ldap_object_class(self.server.ldap_uri)
+        self.assertEqual(l1.__getstate__()['_last_bind'], None)
+        l1_state = pickle.dumps(l1)
+        del l1
+        l2 = pickle.loads(l1_state)
+        self.assertEqual(l2._last_bind, None)
+        self.assertEqual(l2.whoami_s(), '')
+
     def test105_reconnect_restore(self):
         l1 = self.ldap_object_class(self.server.ldap_uri, retry_max=2, retry_delay=1)
         bind_dn = 'cn=user1,'+self.server.suffix
@@ -643,6 +652,14 @@ class Test01_ReconnectLDAPObject(Test00_SimpleLDAPObject):
             self.server._start_slapd()
         self.assertEqual(l1.whoami_s(), 'dn:'+bind_dn)
 
+    def test106_method_names(self):
+        for name in ('search_ext_s', 'passwd_s', 'whoami_s'):
+            method = getattr(ReconnectLDAPObject, name)
+            self.assertEqual(method.__name__, name)
+            self.assertEqual(
+                method.__qualname__, 'ReconnectLDAPObject.' + name
+            )
+
 
 @requires_init_fd()
 class Test03_SimpleLDAPObjectWithFileno(Test00_SimpleLDAPObject):
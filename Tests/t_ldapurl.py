@@ -11,7 +11,7 @@ from urllib.parse import quote
 os.environ['LDAPNOINIT'] = '1'
 
 import ldapurl
-from ldapurl import LDAPUrl
+from ldapurl import LDAPUrl, LDAPUrlExtension
 
 
 class MyLDAPUrl(LDAPUrl):
@@ -225,6 +225,19 @@ class TestLDAPUrl(unittest.TestCase):
         self.assertEqual(u.cred, "???")
         self.assertEqual(u.trace_level, "8")
 
+    def test_eq(self):
+        u = LDAPUrl("ldap://host/dc=example,dc=com?cn?sub?(cn=a)?!trace=8")
+        self.assertEqual(u, LDAPUrl(u.unparse()))
+        self.assertNotEqual(u, LDAPUrl("ldap://host/dc=example,dc=com"))
+        self.assertNotEqual(u, LDAPUrl(u.unparse().replace("!trace", "trace")))
+        self.assertEqual(
+            u.extensions["trace"],
+            LDAPUrlExtension(critical=1, extype="trace", exvalue="8")
+        )
+        # comparing with other types must not raise
+        self.assertNotEqual(u, u.unparse())
+        self.assertNotEqual(u.extensions["trace"], "!trace=8")
+
     def test_parse_default_hostport(self):
         u = LDAPUrl("ldap://")
         self.assertEqual(u.urlscheme, "ldap")
@@ -279,6 +292,10 @@ class TestLDAPUrl(unittest.TestCase):
         self.assertEqual(u.hostport, "[::1]:123")
         u = LDAPUrl("ldap://[::1]:123")
         self.assertEqual(u.hostport, "[::1]:123")
+        u = LDAPUrl("ldap://a?cn")
+        self.assertEqual(u.hostport, "a")
+        self.assertEqual(u.dn, "")
+        self.assertEqual(u.attrs, ["cn"])
 
     def test_parse_dn(self):
         u = LDAPUrl("ldap:///")